@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt
 import matplotlib.figure
+import numpy as np
 import pandas as pd
+from matplotlib.collections import PathCollection
+from matplotlib.markers import MarkerStyle
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
 
 from reading_stats.utils.colors import Colors
 from reading_stats.utils.styles import Styles
@@ -51,6 +56,46 @@ def add_source(ax: plt.Axes, source: str,
     )
 
 
+def spread_labels(y: np.ndarray, min_gap: float) -> np.ndarray:
+    """Return label positions at least `min_gap` apart and within the axes,
+    as close to `y` as possible in the least-squares sense.
+
+    Sorting the positions and subtracting `i * min_gap` from the i-th one
+    turns the problem into an isotonic regression, solved in one pass with
+    pool-adjacent-violators, so the cost is dominated by the sort. Clipping
+    the fit keeps every label at least `min_gap / 2` inside [0, 1]; when the
+    labels don't fit, they are centered.
+    """
+    order = np.argsort(y, kind="stable")
+    offsets = np.arange(len(y)) * min_gap
+    means, counts = [], []
+    for value in y[order] - offsets:
+        means.append(value)
+        counts.append(1)
+        while len(means) > 1 and means[-2] > means[-1]:
+            mean, count = means.pop(), counts.pop()
+            means[-1] = ((means[-1] * counts[-1] + mean * count)
+                         / (counts[-1] + count))
+            counts[-1] += count
+
+    low = min_gap / 2
+    high = 1 - min_gap / 2 - offsets[-1] if len(y) else low
+    fitted = np.repeat(means, counts)
+    if low <= high:
+        fitted = np.clip(fitted, low, high)
+    else:
+        fitted = np.full(len(y), (low + high) / 2)
+
+    spread = np.empty(len(y))
+    spread[order] = fitted + offsets
+    return spread
+
+
+def _marker_path(marker: str) -> Path:
+    style = MarkerStyle(marker)
+    return style.get_path().transformed(style.get_transform())
+
+
 def highlight_points(
         ax: plt.Axes,
         df: pd.DataFrame,
@@ -59,21 +104,46 @@ def highlight_points(
         x_col: str,
         y_col: str,
         annotation_x: float,
+        markers: dict[str, str] | None = None,
+        min_gap: float = 0.04,
         ) -> None:
-    for label in labels:
-        subset = df[df[label_col] == label]
-        if subset.empty:
-            continue
-        ax.scatter(
-            subset[x_col], subset[y_col],
-            s=10, label=label, zorder=20, linewidth=0.5,
-            facecolor="none", edgecolor=Colors.DARKGRAY,
-        )
+    """Circle the rows whose `label_col` is in `labels` and annotate them.
+
+    All markers are drawn as one collection. Labels are placed at
+    `annotation_x` and spread vertically so that they are at least `min_gap`
+    apart, as a fraction of the axes height.
+    """
+    subset = df[df[label_col].isin(labels)]
+    if subset.empty:
+        return
+    markers = markers or {}
+
+    paths = [_marker_path(markers.get(label, "o"))
+             for label in subset[label_col]]
+    collection = PathCollection(
+        paths, sizes=[10], offsets=subset[[x_col, y_col]].to_numpy(float),
+        offset_transform=ax.transData,
+        facecolors="none", edgecolors=Colors.DARKGRAY, linewidths=0.5,
+        zorder=20,
+    )
+    collection.set_transform(IdentityTransform())
+    ax.add_collection(collection, autolim=False)
+
+    # Annotate the first row of each label, in axes coordinates so the
+    # spacing works on log scales too.
+    points = subset.drop_duplicates(label_col)
+    xy = points[[x_col, y_col]].to_numpy(float)
+    to_axes = ax.transScale + ax.transLimits
+    y_axes = to_axes.transform(xy)[:, 1]
+    text_y = to_axes.inverted().transform(np.column_stack(
+        [np.zeros(len(xy)), spread_labels(y_axes, min_gap)]))[:, 1]
+
+    for label, (x, y), y_text in zip(points[label_col], xy, text_y):
         ax.annotate(
             label,
-            (subset[x_col].values[0], subset[y_col].values[0]),
+            (x, y),
             textcoords="data",
-            xytext=(annotation_x, subset[y_col].values[0]),
+            xytext=(annotation_x, y_text),
             ha="left", va="center",
             arrowprops=dict(arrowstyle="-", lw=0.5),
             fontsize=8, fontname=Styles.FONTNAME,
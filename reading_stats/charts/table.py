@@ -1,8 +1,7 @@
 from pathlib import Path
 import pandas as pd
-from reading_stats.utils.paths import ensure_dir
+from reading_stats.utils.output import write_text
 
 
-def to_markdown(df: pd.DataFrame, output_path: Path) -> None:
-    ensure_dir(output_path)
-    output_path.write_text(df.to_markdown(index=False), encoding="utf-8")
+def to_markdown(df: pd.DataFrame, output_path: Path) -> bool:
+    return write_text(output_path, df.to_markdown(index=False))
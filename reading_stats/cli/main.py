@@ -1,13 +1,57 @@
+from pathlib import Path
+
 import typer
+from reading_stats.config import get_config, load_config, set_config
+from reading_stats.db.connection import get_connection
+from reading_stats.db import snapshots, summaries
 from reading_stats.reports import (
     authors_scatter,
     genres_scatter,
     works_scatter,
     author_bibliography,
+    leaderboards,
     next_reads,
+    publication_heatmap,
+    reading_time,
 )
+from reading_stats.utils import profiling
+from reading_stats.utils.output import file_lock
 
 app = typer.Typer(help="Reading stats report generator.")
+db_app = typer.Typer(help="Database maintenance.")
+app.add_typer(db_app, name="db")
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        help=("Record timing, memory and row counts per stage. Can also be"
+              f" enabled with {profiling.ENV_VAR}=1."),
+        ),
+    db: Path | None = typer.Option(
+        None,
+        help=("Database to use instead of the ones in config.toml, including"
+              " the reader databases."),
+        ),
+    out_dir: Path | None = typer.Option(
+        None,
+        help="Directory to write figures and tables to.",
+        ),
+        ):
+    try:
+        cfg = load_config(db_path=db, out_dir=out_dir)
+    except FileNotFoundError as e:
+        raise typer.BadParameter(str(e))
+    set_config(cfg)
+
+    # Serialize runs so overlapping invocations don't interleave outputs.
+    ctx.with_resource(file_lock(cfg.output_lock_file))
+    if profile or profiling.is_enabled():
+        profiling.enable()
+        ctx.call_on_close(
+            lambda: profiling.write_trace(cfg.profile_trace_file))
 
 
 @app.command()
@@ -46,14 +90,68 @@ def next_reads_report():
     next_reads.run()
 
 
+@app.command()
+def reading_time_report():
+    reading_time.run()
+
+
+@app.command()
+def publication(
+    weighted: bool = typer.Option(
+        True,
+        help="Weight each read by its page count.",
+        ),
+        ):
+    publication_heatmap.run(weighted)
+
+
+@app.command()
+def leaderboard(
+    top: int = typer.Option(
+        25,
+        help="Number of rows in each table.",
+        ),
+        ):
+    leaderboards.run(top)
+
+
 @app.command()
 def all():
     authors_scatter.run()
     genres_scatter.run()
     works_scatter.run()
     next_reads.run()
+    reading_time.run()
+    publication_heatmap.run()
     author_bibliography.run("Stephen King")
     author_bibliography.run_table("Stephen King")
+    profiling.print_summary()
+
+
+@db_app.command()
+def rebuild_summaries():
+    cfg = get_config()
+    for db_path in dict.fromkeys([cfg.db_path,
+                                  *(path for _, path in cfg.reader_db_paths)]):
+        conn = get_connection(db_path)
+        summaries.rebuild_summaries(conn)
+        conn.close()
+
+
+@db_app.command()
+def checkpoint(
+    force: bool = typer.Option(
+        False,
+        help="Write a checkpoint even if few changes were logged.",
+        ),
+        ):
+    cfg = get_config()
+    for db_path in dict.fromkeys([cfg.db_path,
+                                  *(path for _, path in cfg.reader_db_paths)]):
+        conn = get_connection(db_path)
+        snapshots.install_snapshots(conn)
+        snapshots.checkpoint(conn, every=0 if force else cfg.checkpoint_every)
+        conn.close()
 
 
 if __name__ == "__main__":
@@ -1,27 +1,150 @@
+import os
 import tomllib
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent
 
-with open(_ROOT / "config.toml", "rb") as f:
-    _cfg = tomllib.load(f)
+CONFIG_ENV_VAR = "READING_STATS_CONFIG"
+DB_ENV_VAR = "READING_STATS_DB"
+OUT_DIR_ENV_VAR = "READING_STATS_OUT_DIR"
 
 
-def _path(value: str) -> Path:
-    return _ROOT / value
+@dataclass(frozen=True)
+class Config:
+    """Resolved paths and settings for a run.
 
+    Inputs (databases and SQL files) are resolved against the directory of
+    the TOML file and outputs against `out_dir`, which defaults to the same
+    directory. Instances are plain data, so they can be pickled and handed to
+    worker processes.
+    """
+    db_path: Path
+    # (reader, database) pairs. A tuple rather than a dict keeps the config
+    # hashable.
+    reader_db_paths: tuple[tuple[str, Path], ...]
+    sql_author_bibliography: Path
+    sql_read_history: Path
+    sql_next_reads: Path
+    sql_read_intervals: Path
+    sql_summaries: Path
+    sql_snapshots: Path
+    authors_data_file: Path
+    authors_fig_file: Path
+    works_data_file: Path
+    works_fig_file: Path
+    read_history_file: Path
+    recent_reads_file: Path
+    next_reads_file: Path
+    genres_data_file: Path
+    genres_fig_file: Path
+    author_biblio_output_dir: Path
+    reading_time_fig_file: Path
+    publication_fig_file: Path
+    leaderboards_output_dir: Path
+    output_lock_file: Path
+    profile_trace_file: Path
+    checkpoint_every: int
 
-db_path = _path(_cfg["database"]["file_path"])
-authors_data_file = _path(_cfg["authors"]["data_output_file"])
-authors_fig_file = _path(_cfg["authors"]["fig_output_file"])
-works_data_file = _path(_cfg["works"]["data_output_file"])
-works_fig_file = _path(_cfg["works"]["fig_output_file"])
-read_history_file = _path(_cfg["read_history"]["data_file"])
-recent_reads_file = _path(_cfg["read_history"]["recent_reads_file"])
-next_reads_file = _path(_cfg["next_reads"]["output_file"])
-genres_data_file = _path(_cfg["genres"]["data_output_file"])
-genres_fig_file = _path(_cfg["genres"]["fig_output_file"])
-sql_author_bibliography = _path(_cfg["author_bibliography"]["query_path"])
-author_biblio_output_dir = _path(_cfg["author_bibliography"]["output_dir"])
-sql_read_history = _path(_cfg["read_history"]["query_path"])
-sql_next_reads = _path(_cfg["next_reads"]["query_path"])
+    @classmethod
+    def from_toml(cls, config_path: Path, db_path: Path | None = None,
+                  out_dir: Path | None = None) -> "Config":
+        with open(config_path, "rb") as f:
+            cfg = tomllib.load(f)
+
+        root = config_path.parent
+        out_dir = out_dir or root
+
+        def _in(value: str) -> Path:
+            return root / value
+
+        def _out(value: str) -> Path:
+            return out_dir / value
+
+        # An explicit database replaces the reader databases too, so runs
+        # against a test copy never read or write the configured ones.
+        if db_path is not None:
+            reader_db_paths = (("default", db_path),)
+        else:
+            db_path = _in(cfg["database"]["file_path"])
+            reader_db_paths = tuple(
+                (reader, _in(file_path))
+                for reader, file_path in cfg.get("readers", {}).items()
+            ) or (("default", db_path),)
+
+        return cls(
+            db_path=db_path,
+            reader_db_paths=reader_db_paths,
+            sql_author_bibliography=_in(
+                cfg["author_bibliography"]["query_path"]),
+            sql_read_history=_in(cfg["read_history"]["query_path"]),
+            sql_next_reads=_in(cfg["next_reads"]["query_path"]),
+            sql_read_intervals=_in(cfg["reading_time"]["query_path"]),
+            sql_summaries=_in(cfg["summaries"]["query_path"]),
+            sql_snapshots=_in(cfg["snapshots"]["query_path"]),
+            authors_data_file=_out(cfg["authors"]["data_output_file"]),
+            authors_fig_file=_out(cfg["authors"]["fig_output_file"]),
+            works_data_file=_out(cfg["works"]["data_output_file"]),
+            works_fig_file=_out(cfg["works"]["fig_output_file"]),
+            read_history_file=_out(cfg["read_history"]["data_file"]),
+            recent_reads_file=_out(cfg["read_history"]["recent_reads_file"]),
+            next_reads_file=_out(cfg["next_reads"]["output_file"]),
+            genres_data_file=_out(cfg["genres"]["data_output_file"]),
+            genres_fig_file=_out(cfg["genres"]["fig_output_file"]),
+            author_biblio_output_dir=_out(
+                cfg["author_bibliography"]["output_dir"]),
+            reading_time_fig_file=_out(cfg["reading_time"]["fig_output_file"]),
+            publication_fig_file=_out(cfg["publication"]["fig_output_file"]),
+            leaderboards_output_dir=_out(cfg["leaderboards"]["output_dir"]),
+            output_lock_file=_out(cfg["output"]["lock_file"]),
+            profile_trace_file=_out(cfg["profiling"]["trace_file"]),
+            checkpoint_every=cfg["snapshots"]["checkpoint_every"],
+        )
+
+    def validate(self) -> None:
+        inputs = dict.fromkeys(
+            [self.db_path, *(path for _, path in self.reader_db_paths)] + [
+                getattr(self, f.name) for f in fields(self)
+                if f.name.startswith("sql_")
+            ])
+        missing = [str(path) for path in inputs if not path.is_file()]
+        if missing:
+            raise FileNotFoundError(
+                f"Missing input files: {', '.join(missing)}.")
+
+
+_config: Config | None = None
+
+
+def load_config(config_path: str | Path | None = None,
+                db_path: str | Path | None = None,
+                out_dir: str | Path | None = None) -> Config:
+    """Load and validate a config, applying environment overrides.
+
+    Explicit arguments take precedence over the `READING_STATS_CONFIG`,
+    `READING_STATS_DB` and `READING_STATS_OUT_DIR` environment variables.
+    """
+    config_path = config_path or os.environ.get(CONFIG_ENV_VAR)
+    db_path = db_path or os.environ.get(DB_ENV_VAR)
+    out_dir = out_dir or os.environ.get(OUT_DIR_ENV_VAR)
+
+    cfg = Config.from_toml(
+        Path(config_path) if config_path else _ROOT / "config.toml",
+        db_path=Path(db_path) if db_path else None,
+        out_dir=Path(out_dir) if out_dir else None,
+    )
+    cfg.validate()
+    return cfg
+
+
+def get_config() -> Config:
+    """Return the active config, loading it on first use."""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def set_config(cfg: Config) -> None:
+    global _config
+    _config = cfg
@@ -1,23 +1,109 @@
+import datetime
+from pathlib import Path
+
 import pandas as pd
 
-from reading_stats import config
+from reading_stats.config import get_config
+from reading_stats.db import snapshots, summaries
 from reading_stats.db.connection import get_connection
+from reading_stats.utils.profiling import profiled
 
 
 def _load_sql(path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def get_read_history() -> pd.DataFrame:
-    sql = _load_sql(config.sql_read_history)
-    return pd.read_sql(sql, get_connection(config.db_path))
+@profiled
+def get_read_history(db_path: Path | None = None) -> pd.DataFrame:
+    cfg = get_config()
+    sql = _load_sql(cfg.sql_read_history)
+    return pd.read_sql(sql, get_connection(db_path or cfg.db_path))
+
+
+@profiled
+def get_next_reads(db_path: Path | None = None) -> pd.DataFrame:
+    cfg = get_config()
+    sql = _load_sql(cfg.sql_next_reads)
+    return pd.read_sql(sql, get_connection(db_path or cfg.db_path))
+
+
+@profiled
+def get_read_intervals(db_path: Path | None = None) -> pd.DataFrame:
+    cfg = get_config()
+    sql = _load_sql(cfg.sql_read_intervals)
+    return pd.read_sql(sql, get_connection(db_path or cfg.db_path))
+
+
+@profiled
+def get_author_bibliography(author: str,
+                            db_path: Path | None = None) -> pd.DataFrame:
+    cfg = get_config()
+    sql = _load_sql(cfg.sql_author_bibliography)
+    return pd.read_sql(sql, get_connection(db_path or cfg.db_path),
+                       params=(author,))
+
+
+def _read_summary(sql: str, db_path: Path | None,
+                  as_of: datetime.date | str | None) -> pd.DataFrame:
+    # Summary tables are kept up to date by triggers, see db.summaries. A
+    # database that predates them gets them on first use.
+    db_path = db_path or get_config().db_path
+    if as_of is not None:
+        return pd.read_sql(sql, snapshots.connect_as_of(db_path, as_of))
+    conn = get_connection(db_path)
+    if not summaries.has_summaries(conn):
+        summaries.rebuild_summaries(conn)
+    return pd.read_sql(sql, conn)
+
+
+@profiled
+def get_author_summary(db_path: Path | None = None,
+                       as_of: datetime.date | str | None = None
+                       ) -> pd.DataFrame:
+    return _read_summary(
+        "SELECT AuthorID, AuthorName, WeightedScore, TotalPages"
+        " FROM AUTHOR_SUMMARY", db_path, as_of)
+
+
+@profiled
+def get_genre_summary(db_path: Path | None = None,
+                      as_of: datetime.date | str | None = None
+                      ) -> pd.DataFrame:
+    return _read_summary(
+        "SELECT Genre, WeightedScore, TotalPages FROM GENRE_SUMMARY",
+        db_path, as_of)
 
 
-def get_next_reads() -> pd.DataFrame:
-    sql = _load_sql(config.sql_next_reads)
-    return pd.read_sql(sql, get_connection(config.db_path))
+@profiled
+def get_work_summary(db_path: Path | None = None,
+                     as_of: datetime.date | str | None = None
+                     ) -> pd.DataFrame:
+    return _read_summary("""
+        SELECT
+            (SELECT MIN(A.Name)
+             FROM AUTHOR_WORK AW
+             JOIN AUTHORS A ON AW.AuthorID = A.AuthorID
+             WHERE AW.WorkID = W.WorkID) AS AuthorName,
+            W.Name AS WorkName,
+            W.WorkType,
+            W.Series,
+            W.NumberInSeries,
+            W.PublishedOn,
+            W.Genre,
+            W.PageCount,
+            WS.ReadScore,
+            W.GoodreadsScore,
+            W.WorkID,
+            WS.TimesRead,
+            WS.LastReadOn
+        FROM WORK_SUMMARY WS
+        JOIN WORKS W ON WS.WorkID = W.WorkID""", db_path, as_of)
 
 
-def get_author_bibliography(author: str) -> pd.DataFrame:
-    sql = _load_sql(config.sql_author_bibliography)
-    return pd.read_sql(sql, get_connection(config.db_path), params=(author,))
+@profiled
+def get_year_summary(db_path: Path | None = None,
+                     as_of: datetime.date | str | None = None
+                     ) -> pd.DataFrame:
+    return _read_summary(
+        "SELECT Year, WorksRead, PagesRead FROM YEAR_SUMMARY ORDER BY Year",
+        db_path, as_of)
@@ -0,0 +1,212 @@
+import datetime
+import json
+import sqlite3
+import warnings
+import zlib
+
+from reading_stats.config import get_config
+from reading_stats.db.summaries import rebuild_summaries
+
+# Tracked table -> primary key. Changes to these tables are logged.
+TRACKED_TABLES = {
+    "READS": "ReadID",
+    "WORKS": "WorkID",
+}
+
+# Tables copied as they are now when rebuilding a past state.
+STATIC_TABLES = ["AUTHORS", "AUTHOR_WORK"]
+
+
+_NO_CHECKPOINTS = ("No snapshot checkpoints. Run `reading-stats db checkpoint`"
+                   " first.")
+
+
+class ApproximateSnapshotWarning(UserWarning):
+    """Issued when a past state is approximated instead of replayed."""
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _log_sql(table: str, columns: list[str], row: str) -> str:
+    key = TRACKED_TABLES[table]
+    data = ", ".join(f"'{c}', {row}.{c}" for c in columns)
+    return (
+        "INSERT INTO SNAPSHOT_LOG (ChangedAt, TableName, RowID, RowData)"
+        f" VALUES (datetime('now'), '{table}', {row}.{key},"
+        f" json_object({data}));\n")
+
+
+def _delete_sql(table: str, where: str = "") -> str:
+    key = TRACKED_TABLES[table]
+    return (
+        "INSERT INTO SNAPSHOT_LOG (ChangedAt, TableName, RowID, RowData)"
+        f" SELECT datetime('now'), '{table}', OLD.{key}, NULL{where};\n")
+
+
+def _trigger_sql(conn: sqlite3.Connection, table: str) -> str:
+    key = TRACKED_TABLES[table]
+    columns = _columns(conn, table)
+    name = f"SNAPSHOT_{table}"
+    return (
+        f"DROP TRIGGER IF EXISTS {name}_INSERT;\n"
+        f"CREATE TRIGGER {name}_INSERT AFTER INSERT ON {table}\n"
+        f"BEGIN\n{_log_sql(table, columns, 'NEW')}END;\n"
+        f"DROP TRIGGER IF EXISTS {name}_UPDATE;\n"
+        f"CREATE TRIGGER {name}_UPDATE AFTER UPDATE ON {table}\n"
+        f"BEGIN\n"
+        f"{_delete_sql(table, f' WHERE OLD.{key} <> NEW.{key}')}"
+        f"{_log_sql(table, columns, 'NEW')}END;\n"
+        f"DROP TRIGGER IF EXISTS {name}_DELETE;\n"
+        f"CREATE TRIGGER {name}_DELETE AFTER DELETE ON {table}\n"
+        f"BEGIN\n{_delete_sql(table)}END;\n"
+    )
+
+
+def install_snapshots(conn: sqlite3.Connection) -> None:
+    """Create the snapshot tables and the change-logging triggers."""
+    sql = get_config().sql_snapshots.read_text(encoding="utf-8")
+    conn.executescript(sql)
+    conn.executescript("".join(
+        _trigger_sql(conn, table) for table in TRACKED_TABLES))
+
+
+def checkpoint(conn: sqlite3.Connection, every: int = 0) -> bool:
+    """Store the full state of the tracked tables.
+
+    Skipped unless at least `every` changes were logged since the last
+    checkpoint. Returns whether a checkpoint was written.
+    """
+    with conn:
+        last_change_id = conn.execute(
+            "SELECT COALESCE(MAX(ChangeID), 0) FROM SNAPSHOT_LOG").fetchone()[0]
+        previous = conn.execute(
+            "SELECT MAX(LastChangeID) FROM SNAPSHOT_CHECKPOINTS").fetchone()[0]
+        if previous is not None and last_change_id - previous < max(every, 1):
+            return False
+
+        state = {
+            table: {
+                "columns": _columns(conn, table),
+                "rows": [list(row) for row in conn.execute(
+                    f"SELECT * FROM {table}")],
+            }
+            for table in TRACKED_TABLES
+        }
+        conn.execute(
+            "INSERT INTO SNAPSHOT_CHECKPOINTS (CreatedAt, LastChangeID, Data)"
+            " VALUES (datetime('now'), ?, ?)",
+            (last_change_id, zlib.compress(json.dumps(state).encode("utf-8"))),
+        )
+    return True
+
+
+def _read_date(row: list, columns: list[str]) -> str | None:
+    finish, start = (row[columns.index(c)] for c in ("FinishDate", "StartDate"))
+    date = finish or start
+    return date[:10] if date else None
+
+
+def _restore(conn: sqlite3.Connection,
+             as_of: datetime.date) -> tuple[dict, bool]:
+    """Rebuild the tracked tables as they were at the end of `as_of`.
+
+    Returns the tables and whether they are an approximation. Dates before
+    the first checkpoint can't be replayed from the log, so the earliest
+    checkpoint is used with the reads read after `as_of` removed; undated
+    reads are kept, as they predate the dated history.
+    """
+    has_checkpoints = conn.execute(
+        "SELECT 1 FROM sqlite_master"
+        " WHERE type = 'table' AND name = 'SNAPSHOT_CHECKPOINTS'").fetchone()
+    if has_checkpoints is None:
+        raise ValueError(_NO_CHECKPOINTS)
+
+    until = f"{as_of.isoformat()} 23:59:59"
+    row = conn.execute(
+        "SELECT LastChangeID, Data FROM SNAPSHOT_CHECKPOINTS"
+        " WHERE CreatedAt <= ? ORDER BY CreatedAt DESC, CheckpointID DESC"
+        " LIMIT 1", (until,)).fetchone()
+    approximate = row is None
+    if approximate:
+        row = conn.execute(
+            "SELECT LastChangeID, Data FROM SNAPSHOT_CHECKPOINTS"
+            " ORDER BY CreatedAt, CheckpointID LIMIT 1").fetchone()
+    if row is None:
+        raise ValueError(_NO_CHECKPOINTS)
+    last_change_id, data = row
+
+    state = json.loads(zlib.decompress(data))
+    tables = {}
+    for table, key in TRACKED_TABLES.items():
+        columns = state[table]["columns"]
+        key_idx = columns.index(key)
+        tables[table] = (
+            columns, {r[key_idx]: r for r in state[table]["rows"]})
+
+    if approximate:
+        columns, rows = tables["READS"]
+        for read_id, r in list(rows.items()):
+            date = _read_date(r, columns)
+            if date is not None and date > as_of.isoformat():
+                del rows[read_id]
+        return tables, True
+
+    changes = conn.execute(
+        "SELECT TableName, RowID, RowData FROM SNAPSHOT_LOG"
+        " WHERE ChangeID > ? AND ChangedAt <= ? ORDER BY ChangeID",
+        (last_change_id, until))
+    for table, row_id, row_data in changes:
+        columns, rows = tables[table]
+        if row_data is None:
+            rows.pop(row_id, None)
+        else:
+            values = json.loads(row_data)
+            rows[row_id] = [values.get(c) for c in columns]
+    return tables, False
+
+
+def connect_as_of(db_path, as_of: datetime.date | str) -> sqlite3.Connection:
+    """Return an in-memory database holding the state at the end of `as_of`.
+
+    READS and WORKS are restored from the nearest earlier checkpoint plus the
+    logged changes after it; AUTHORS and AUTHOR_WORK are copied as they are
+    now. The summary tables are rebuilt, so the usual summary queries work on
+    the returned connection. For dates before the first checkpoint the state
+    is approximated from the read dates and an `ApproximateSnapshotWarning`
+    is issued.
+    """
+    if isinstance(as_of, str):
+        as_of = datetime.date.fromisoformat(as_of)
+
+    src = sqlite3.connect(db_path)
+    mem = sqlite3.connect(":memory:")
+    mem.row_factory = sqlite3.Row
+    try:
+        schema = dict(src.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+        for table in [*TRACKED_TABLES, *STATIC_TABLES]:
+            mem.execute(schema[table])
+
+        tables, approximate = _restore(src, as_of)
+        for table, (columns, rows) in tables.items():
+            mem.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)})"
+                f" VALUES ({', '.join('?' * len(columns))})",
+                rows.values())
+        for table in STATIC_TABLES:
+            columns = _columns(src, table)
+            mem.executemany(
+                f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})",
+                src.execute(f"SELECT * FROM {table}"))
+    finally:
+        src.close()
+
+    if approximate:
+        warnings.warn(
+            f"{as_of.isoformat()} is before the first checkpoint; stats are"
+            " approximated from the read dates.",
+            ApproximateSnapshotWarning, stacklevel=2)
+    rebuild_summaries(mem)
+    return mem
@@ -0,0 +1,192 @@
+import sqlite3
+
+from reading_stats.config import get_config
+
+_READ_YEAR = ("CAST(strftime('%Y', COALESCE(date({r}.FinishDate),"
+              " date({r}.StartDate))) AS INTEGER)")
+
+# Summary table -> (key expression, query computing the rows). `{keys}` is
+# filled with a subquery so a trigger only recomputes the rows it touches,
+# and with a plain key list match for a full rebuild. The queries join reads
+# to every author of the work like sql/read_history.sql, so the summaries
+# give the same results as aggregating the read history.
+SUMMARIES = {
+    "AUTHOR_SUMMARY": ("A.AuthorID", """
+        SELECT
+            A.AuthorID,
+            A.Name,
+            COALESCE(SUM(R.Score * W.PageCount), 0),
+            COALESCE(SUM(W.PageCount), 0)
+        FROM READS R
+        JOIN WORKS W ON R.WorkID = W.WorkID
+        JOIN AUTHOR_WORK AW ON W.WorkID = AW.WorkID
+        JOIN AUTHORS A ON AW.AuthorID = A.AuthorID
+        WHERE R.Status IN ('FINISHED', 'NOT FINISHED')
+            AND A.AuthorID IN ({keys})
+        GROUP BY A.AuthorID"""),
+    "GENRE_SUMMARY": ("W.Genre", """
+        SELECT
+            W.Genre,
+            COALESCE(SUM(R.Score * W.PageCount), 0),
+            COALESCE(SUM(W.PageCount), 0)
+        FROM READS R
+        JOIN WORKS W ON R.WorkID = W.WorkID
+        JOIN AUTHOR_WORK AW ON W.WorkID = AW.WorkID
+        JOIN AUTHORS A ON AW.AuthorID = A.AuthorID
+        WHERE R.Status IN ('FINISHED', 'NOT FINISHED')
+            AND W.Genre IN ({keys})
+        GROUP BY W.Genre"""),
+    "WORK_SUMMARY": ("R.WorkID", """
+        SELECT WorkID, TimesRead, ReadScore, LastReadOn
+        FROM (
+            SELECT
+                R.WorkID AS WorkID,
+                COUNT(*) OVER (PARTITION BY R.WorkID) AS TimesRead,
+                R.Score AS ReadScore,
+                COALESCE(date(R.FinishDate), date(R.StartDate)) AS LastReadOn,
+                ROW_NUMBER() OVER (
+                    PARTITION BY R.WorkID
+                    ORDER BY
+                        COALESCE(date(R.FinishDate), date(R.StartDate)) IS NULL,
+                        COALESCE(date(R.FinishDate), date(R.StartDate)) DESC,
+                        R.StartDate,
+                        R.Score DESC
+                ) AS ReadRank
+            FROM READS R
+            JOIN WORKS W ON R.WorkID = W.WorkID
+            JOIN AUTHOR_WORK AW ON W.WorkID = AW.WorkID
+            JOIN AUTHORS A ON AW.AuthorID = A.AuthorID
+            WHERE R.Status = 'FINISHED'
+                AND R.WorkID IN ({keys})
+        )
+        WHERE ReadRank = 1"""),
+    "YEAR_SUMMARY": (_READ_YEAR.format(r="R"), f"""
+        SELECT
+            {_READ_YEAR.format(r="R")} AS Year,
+            COUNT(*),
+            COALESCE(SUM(W.PageCount), 0)
+        FROM READS R
+        JOIN WORKS W ON R.WorkID = W.WorkID
+        WHERE R.Status = 'FINISHED'
+            AND {_READ_YEAR.format(r="R")} IN ({{keys}})
+        GROUP BY Year"""),
+}
+
+_SUMMARY_KEYS = {
+    "AUTHOR_SUMMARY": "AuthorID",
+    "GENRE_SUMMARY": "Genre",
+    "WORK_SUMMARY": "WorkID",
+    "YEAR_SUMMARY": "Year",
+}
+
+
+def _read_keys(row: str) -> dict[str, str]:
+    return {
+        "AUTHOR_SUMMARY":
+            f"SELECT AuthorID FROM AUTHOR_WORK WHERE WorkID = {row}.WorkID",
+        "GENRE_SUMMARY": f"SELECT Genre FROM WORKS WHERE WorkID = {row}.WorkID",
+        "WORK_SUMMARY": f"SELECT {row}.WorkID",
+        "YEAR_SUMMARY": f"SELECT {_READ_YEAR.format(r=row)}",
+    }
+
+
+def _work_keys(row: str) -> dict[str, str]:
+    return {
+        "AUTHOR_SUMMARY":
+            f"SELECT AuthorID FROM AUTHOR_WORK WHERE WorkID = {row}.WorkID",
+        "GENRE_SUMMARY": f"SELECT {row}.Genre",
+        "WORK_SUMMARY": f"SELECT {row}.WorkID",
+        "YEAR_SUMMARY": (f"SELECT {_READ_YEAR.format(r='R')} FROM READS R"
+                         f" WHERE R.WorkID = {row}.WorkID"),
+    }
+
+
+def _author_work_keys(row: str) -> dict[str, str]:
+    return {
+        "AUTHOR_SUMMARY": f"SELECT {row}.AuthorID",
+        "GENRE_SUMMARY": f"SELECT Genre FROM WORKS WHERE WorkID = {row}.WorkID",
+        "WORK_SUMMARY": f"SELECT {row}.WorkID",
+    }
+
+
+def _author_keys(row: str) -> dict[str, str]:
+    return {
+        "AUTHOR_SUMMARY": f"SELECT {row}.AuthorID",
+        "GENRE_SUMMARY": (
+            "SELECT W.Genre FROM AUTHOR_WORK AW"
+            " JOIN WORKS W ON AW.WorkID = W.WorkID"
+            f" WHERE AW.AuthorID = {row}.AuthorID"),
+        "WORK_SUMMARY":
+            f"SELECT WorkID FROM AUTHOR_WORK WHERE AuthorID = {row}.AuthorID",
+    }
+
+
+def _union(*keys: dict[str, str]) -> dict[str, str]:
+    tables = dict.fromkeys(t for k in keys for t in k)
+    return {t: " UNION ".join(k[t] for k in keys if t in k) for t in tables}
+
+
+# Trigger name -> (event, keys of the summary rows the event can change).
+# Foreign keys are not enforced, so every insert, update and delete on the
+# source tables is covered, including ones that leave dangling references.
+TRIGGERS = {
+    "SUMMARY_READS_INSERT": ("AFTER INSERT ON READS", _read_keys("NEW")),
+    "SUMMARY_READS_UPDATE": (
+        "AFTER UPDATE ON READS", _union(_read_keys("OLD"), _read_keys("NEW"))),
+    "SUMMARY_READS_DELETE": ("AFTER DELETE ON READS", _read_keys("OLD")),
+    "SUMMARY_WORKS_INSERT": ("AFTER INSERT ON WORKS", _work_keys("NEW")),
+    "SUMMARY_WORKS_UPDATE": (
+        "AFTER UPDATE ON WORKS", _union(_work_keys("OLD"), _work_keys("NEW"))),
+    "SUMMARY_WORKS_DELETE": ("AFTER DELETE ON WORKS", _work_keys("OLD")),
+    "SUMMARY_AUTHOR_WORK_INSERT": (
+        "AFTER INSERT ON AUTHOR_WORK", _author_work_keys("NEW")),
+    "SUMMARY_AUTHOR_WORK_UPDATE": (
+        "AFTER UPDATE ON AUTHOR_WORK",
+        _union(_author_work_keys("OLD"), _author_work_keys("NEW"))),
+    "SUMMARY_AUTHOR_WORK_DELETE": (
+        "AFTER DELETE ON AUTHOR_WORK", _author_work_keys("OLD")),
+    "SUMMARY_AUTHORS_INSERT": ("AFTER INSERT ON AUTHORS", _author_keys("NEW")),
+    "SUMMARY_AUTHORS_UPDATE": (
+        "AFTER UPDATE ON AUTHORS",
+        _union(_author_keys("OLD"), _author_keys("NEW"))),
+    "SUMMARY_AUTHORS_DELETE": ("AFTER DELETE ON AUTHORS", _author_keys("OLD")),
+}
+
+
+def _refresh_sql(table: str, keys: str) -> str:
+    query = SUMMARIES[table][1].format(keys=keys)
+    return (
+        f"DELETE FROM {table} WHERE {_SUMMARY_KEYS[table]} IN ({keys});\n"
+        f"INSERT INTO {table}{query};\n"
+    )
+
+
+def _trigger_sql(name: str, event: str, keys: dict[str, str]) -> str:
+    body = "".join(_refresh_sql(table, k) for table, k in keys.items())
+    return (f"DROP TRIGGER IF EXISTS {name};\n"
+            f"CREATE TRIGGER {name} {event}\nBEGIN\n{body}END;\n")
+
+
+def install_summaries(conn: sqlite3.Connection) -> None:
+    """Create the summary tables, their indexes and the triggers."""
+    sql = get_config().sql_summaries.read_text(encoding="utf-8")
+    conn.executescript(sql)
+    conn.executescript("".join(
+        _trigger_sql(name, event, keys)
+        for name, (event, keys) in TRIGGERS.items()))
+
+
+def has_summaries(conn: sqlite3.Connection) -> bool:
+    names = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return set(SUMMARIES) <= names
+
+
+def rebuild_summaries(conn: sqlite3.Connection) -> None:
+    """Install the summaries and recompute every row from scratch."""
+    install_summaries(conn)
+    with conn:
+        for table, (key, query) in SUMMARIES.items():
+            conn.execute(f"DELETE FROM {table}")
+            # `x IN (x)` keeps every row with a non-NULL key.
+            conn.execute(f"INSERT INTO {table}{query.format(keys=key)}")
@@ -1,6 +1,6 @@
 import argparse
 import matplotlib.pyplot as plt
-from reading_stats import config
+from reading_stats.config import get_config
 from reading_stats.charts.bar import apply_base_style
 from reading_stats.charts.scatter import add_titles, add_source
 from reading_stats.services.bibliography import (
@@ -10,8 +10,11 @@ from reading_stats.services.bibliography import (
 from reading_stats.utils.colors import Colors
 from reading_stats.utils.styles import Styles
 from reading_stats.charts.table import to_markdown
+from reading_stats.utils.output import save_figure
+from reading_stats.utils.profiling import profiled, span
 
 
+@profiled
 def run(author: str) -> None:
     totals = get_author_bibliography(author)
 
@@ -58,14 +61,17 @@ def run(author: str) -> None:
 
     filename = author.replace(".", "").replace(" ", "_").lower() \
         + "_bibliography.png"
-    fig.savefig(config.authors_fig_file.parent / filename, dpi=1000)
+    with span("reports.author_bibliography.savefig"):
+        save_figure(fig, get_config().authors_fig_file.parent / filename,
+                    dpi=1000)
     plt.close(fig)
 
 
+@profiled
 def run_table(author: str) -> None:
     df = get_author_bibliography_for_table(author)
     filename = author.replace(".", "").replace(" ", "_").lower() + ".md"
-    to_markdown(df, config.author_biblio_output_dir / filename)
+    to_markdown(df, get_config().author_biblio_output_dir / filename)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import matplotlib.pyplot as plt
-from reading_stats import config
+from reading_stats.config import get_config
 from reading_stats.charts.scatter import (
     apply_base_style,
     add_titles,
@@ -8,6 +8,8 @@ from reading_stats.charts.scatter import (
     )
 from reading_stats.services import authors
 from reading_stats.utils.colors import Colors
+from reading_stats.utils.output import save_figure
+from reading_stats.utils.profiling import profiled, span
 
 AUTHORS_TO_HIGHLIGHT = [
         "Stephen King",
@@ -21,6 +23,7 @@ AUTHORS_TO_HIGHLIGHT = [
     ]
 
 
+@profiled
 def run() -> None:
     df = authors.get_author_stats()
 
@@ -63,7 +66,8 @@ def run() -> None:
 
     fig.tight_layout()
     ax.set_position((0.05, 0.12, 0.66, 0.7))
-    fig.savefig(config.authors_fig_file, dpi=1000)
+    with span("reports.authors_scatter.savefig"):
+        save_figure(fig, get_config().authors_fig_file, dpi=1000)
     plt.close(fig)
 
 
@@ -1,13 +1,16 @@
 import matplotlib.pyplot as plt
-from reading_stats import config
+from reading_stats.config import get_config
 from reading_stats.charts.scatter import (
     apply_base_style,
     add_titles,
     add_source,
+    highlight_points,
 )
 from reading_stats.services import genres
 from reading_stats.utils.colors import Colors
 from reading_stats.utils.styles import Styles
+from reading_stats.utils.output import save_figure
+from reading_stats.utils.profiling import profiled, span
 
 GENRES_TO_HIGHLIGHT = [
     "Fiction: Science Fiction",
@@ -28,6 +31,7 @@ TOP_LEVEL_GENRES = [
 ]
 
 
+@profiled
 def run() -> None:
     df = genres.get_genre_stats()
 
@@ -69,31 +73,23 @@ def run() -> None:
     )
     add_source(ax, "https://github.com/ffiza/reading-stats")
 
-    for genre in GENRES_TO_HIGHLIGHT:
-        subset = df[df["Genre"] == genre]
-        if subset.empty:
-            continue
-        top_level = ":".join(genre.split(":")[:2]).strip()
-        ax.scatter(
-            subset["AverageScore"], subset["TotalPages"],
-            s=10, label=genre, zorder=20, linewidth=0.5,
-            marker=Styles.GENRE_SYMBOLS[top_level],
-            facecolor="none", edgecolor=Colors.DARKGRAY,
-        )
-        ax.annotate(
-            genre,
-            (subset["AverageScore"].values[0], subset["TotalPages"].values[0]),
-            textcoords="data",
-            xytext=(5.1, subset["TotalPages"].values[0]),
-            ha="left", va="center",
-            arrowprops=dict(arrowstyle="-", lw=0.5),
-            fontsize=8, fontname=Styles.FONTNAME,
-            color=Colors.DARKGRAY, zorder=25,
-        )
+    highlight_points(
+        ax, df,
+        labels=GENRES_TO_HIGHLIGHT,
+        label_col="Genre",
+        x_col="AverageScore",
+        y_col="TotalPages",
+        annotation_x=5.1,
+        markers={
+            genre: Styles.GENRE_SYMBOLS[":".join(genre.split(":")[:2]).strip()]
+            for genre in GENRES_TO_HIGHLIGHT
+        },
+    )
 
     fig.tight_layout()
     ax.set_position((0.05, 0.12, 0.66, 0.7))
-    fig.savefig(config.genres_fig_file, dpi=1000)
+    with span("reports.genres_scatter.savefig"):
+        save_figure(fig, get_config().genres_fig_file, dpi=1000)
     plt.close(fig)
 
 
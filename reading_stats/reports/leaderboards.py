@@ -0,0 +1,30 @@
+from reading_stats.config import get_config
+from reading_stats.charts.table import to_markdown
+from reading_stats.services import readers
+from reading_stats.utils.profiling import profiled
+
+COLUMN_NAMES = {
+    "AuthorName": "Author",
+    "WeightedReadScore": "Average score",
+    "AverageScore": "Average score",
+    "TotalPages": "Pages read",
+}
+
+
+@profiled
+def run(top: int = 25) -> None:
+    df = readers.get_author_leaderboard()
+    to_markdown(
+        df.head(top).rename(columns=COLUMN_NAMES).round(2),
+        get_config().leaderboards_output_dir / "author_leaderboard.md",
+    )
+
+    df = readers.get_genre_leaderboard()
+    to_markdown(
+        df.head(top).rename(columns=COLUMN_NAMES).round(2),
+        get_config().leaderboards_output_dir / "genre_leaderboard.md",
+    )
+
+
+if __name__ == "__main__":
+    run()
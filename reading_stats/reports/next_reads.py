@@ -1,11 +1,13 @@
-from reading_stats import config
+from reading_stats.config import get_config
 from reading_stats.charts.table import to_markdown
 from reading_stats.services.next_reads import get_next_reads_for_table
+from reading_stats.utils.profiling import profiled
 
 
+@profiled
 def run() -> None:
     df = get_next_reads_for_table()
-    to_markdown(df, config.next_reads_file)
+    to_markdown(df, get_config().next_reads_file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import LinearSegmentedColormap
+from reading_stats.config import get_config
+from reading_stats.charts.bar import apply_base_style
+from reading_stats.charts.scatter import add_titles, add_source
+from reading_stats.services import publication
+from reading_stats.utils.colors import Colors
+from reading_stats.utils.output import save_figure
+from reading_stats.utils.profiling import profiled, span
+from reading_stats.utils.styles import Styles
+
+CMAP = LinearSegmentedColormap.from_list(
+    "reading_stats", [Colors.CYAN, Colors.BLUE, Colors.PURPLE])
+
+
+@profiled
+def run(weighted: bool = True) -> None:
+    hist = publication.get_publication_vs_read_date(weighted=weighted)
+    if hist.counts.size == 0:
+        return
+
+    fig, ax = plt.subplots(figsize=(7, 5))
+    apply_base_style(fig, ax)
+
+    mesh = ax.pcolormesh(
+        hist.read_edges, hist.published_edges,
+        np.ma.masked_equal(hist.counts, 0),
+        cmap=CMAP, zorder=10,
+    )
+
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=7))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %Y"))
+    ax.set_xlabel("READ DATE", fontsize=7, color=Colors.DARKGRAY)
+    ax.set_ylabel("PUBLISHED ON", rotation=0, fontsize=7,
+                  color=Colors.DARKGRAY)
+    ax.yaxis.set_label_coords(0.05, 1.02)
+
+    add_titles(
+        ax,
+        title="Old Books, New Books",
+        subtitle=(
+            "This shows when the works I've read were published against"
+            " when I read them, binned\nby decade and month."
+        ),
+    )
+    add_source(ax, "https://github.com/ffiza/reading-stats",
+               source_text_xanchor=0.03)
+
+    fig.tight_layout()
+    ax.set_position((0.09, 0.12, 0.76, 0.7))
+
+    cbar = fig.colorbar(mesh, cax=fig.add_axes((0.88, 0.12, 0.015, 0.7)))
+    cbar.outline.set_visible(False)
+    cbar.ax.tick_params(length=0, labelsize=7)
+    cbar.set_label("PAGES READ" if weighted else "WORKS READ",
+                   fontsize=7, color=Colors.DARKGRAY)
+    for label in cbar.ax.get_yticklabels():
+        label.set_fontname(Styles.FONTNAME)
+
+    with span("reports.publication_heatmap.savefig"):
+        save_figure(fig, get_config().publication_fig_file, dpi=1000)
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    run()
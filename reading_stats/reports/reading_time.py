@@ -0,0 +1,59 @@
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+from reading_stats.config import get_config
+from reading_stats.charts.bar import apply_base_style
+from reading_stats.charts.scatter import add_titles, add_source
+from reading_stats.services import reading_time
+from reading_stats.utils.colors import Colors
+from reading_stats.utils.output import save_figure
+from reading_stats.utils.profiling import profiled, span
+
+
+@profiled
+def run() -> None:
+    df = reading_time.get_concurrency()
+    if df.empty:
+        return
+
+    fig, ax = plt.subplots(figsize=(7, 5))
+    apply_base_style(fig, ax)
+
+    ax.fill_between(
+        df["Date"], df["BooksInProgress"], step="post",
+        color=Colors.BLUE, linewidth=0,
+    )
+    ax.step(
+        df["Date"], df["BooksInProgress"], where="post",
+        color=Colors.DARKGRAY, linewidth=0.5,
+    )
+
+    ax.set_xlim(df["Date"].min(), df["Date"].max())
+    ax.set_ylim(0, df["BooksInProgress"].max() + 1)
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=7))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %Y"))
+    ax.set_xlabel("DATE", fontsize=7, color=Colors.DARKGRAY)
+    ax.set_ylabel("BOOKS IN PROGRESS", rotation=0, fontsize=7,
+                  color=Colors.DARKGRAY)
+    ax.yaxis.set_label_coords(0.05, 1.02)
+
+    add_titles(
+        ax,
+        title="Reading Overlap",
+        subtitle=(
+            "This shows how many works I was reading at the same time on"
+            " each day, from the start\nand finish dates of all reads in the"
+            " database."
+        ),
+    )
+    add_source(ax, "https://github.com/ffiza/reading-stats",
+               source_text_xanchor=0.03)
+
+    fig.tight_layout()
+    ax.set_position((0.05, 0.12, 0.9, 0.7))
+    with span("reports.reading_time.savefig"):
+        save_figure(fig, get_config().reading_time_fig_file, dpi=1000)
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    run()
@@ -1,5 +1,5 @@
 import matplotlib.pyplot as plt
-from reading_stats import config
+from reading_stats.config import get_config
 from reading_stats.charts.scatter import (
     apply_base_style,
     add_titles,
@@ -9,6 +9,8 @@ from reading_stats.charts.scatter import (
 from reading_stats.services import works
 from reading_stats.utils.colors import Colors
 from reading_stats.utils.styles import Styles
+from reading_stats.utils.output import save_figure
+from reading_stats.utils.profiling import profiled, span
 
 WORKS_TO_HIGHLIGHT = [
     "The Stand",
@@ -20,6 +22,7 @@ WORKS_TO_HIGHLIGHT = [
 ]
 
 
+@profiled
 def run() -> None:
     df = works.get_works_stats()
 
@@ -70,7 +73,8 @@ def run() -> None:
 
     fig.tight_layout()
     ax.set_position((0.05, 0.12, 0.66, 0.7))
-    fig.savefig(config.works_fig_file, dpi=1000)
+    with span("reports.works_scatter.savefig"):
+        save_figure(fig, get_config().works_fig_file, dpi=1000)
     plt.close(fig)
 
 
@@ -1,20 +1,29 @@
+import datetime
+from pathlib import Path
+
 import pandas as pd
 from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
+
+
+@profiled
+def get_author_stats(db_path: Path | None = None,
+                     as_of: datetime.date | str | None = None) -> pd.DataFrame:
+    return finalize_author_stats(get_author_partials(db_path, as_of))
 
 
-def get_author_stats() -> pd.DataFrame:
-    df = queries.get_read_history()
-    df = df[df["ReadStatus"].isin(["FINISHED", "NOT FINISHED"])]
-    df["WeightedScore"] = df["ReadScore"] * df["PageCount"]
+@profiled
+def get_author_partials(db_path: Path | None = None,
+                        as_of: datetime.date | str | None = None
+                        ) -> pd.DataFrame:
+    return queries.get_author_summary(db_path, as_of)
 
-    avg_scores = (
-        df.groupby(["AuthorID", "AuthorName"])
-        .agg(WeightedReadScore=("WeightedScore", "sum"),
-             TotalPages=("PageCount", "sum")))
 
+def finalize_author_stats(partials: pd.DataFrame) -> pd.DataFrame:
+    avg_scores = partials.rename(
+        columns={"WeightedScore": "WeightedReadScore"})
     avg_scores["WeightedReadScore"] = (
         avg_scores["WeightedReadScore"] / avg_scores["TotalPages"])
 
-    avg_scores = (avg_scores.reset_index().sort_values("WeightedReadScore",
-                                                       ascending=False))
+    avg_scores = avg_scores.sort_values("WeightedReadScore", ascending=False)
     return avg_scores
@@ -1,13 +1,16 @@
 import pandas as pd
 from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
 from reading_stats.utils.styles import Styles
 
 
+@profiled
 def get_author_bibliography(author: str) -> pd.DataFrame:
     df = queries.get_author_bibliography(author)
     return _compute_totals(df)
 
 
+@profiled
 def get_author_bibliography_for_table(author: str) -> pd.DataFrame:
     df = queries.get_author_bibliography(author)
     cols_to_drop = ["AuthorName", "AuthorID", "Genre", "WorkID", "StartDate"]
@@ -1,20 +1,29 @@
+import datetime
+from pathlib import Path
+
 import pandas as pd
 from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
+
+
+@profiled
+def get_genre_stats(db_path: Path | None = None,
+                    as_of: datetime.date | str | None = None) -> pd.DataFrame:
+    return finalize_genre_stats(get_genre_partials(db_path, as_of))
+
 
+@profiled
+def get_genre_partials(db_path: Path | None = None,
+                       as_of: datetime.date | str | None = None
+                       ) -> pd.DataFrame:
+    return queries.get_genre_summary(db_path, as_of)
 
-def get_genre_stats() -> pd.DataFrame:
-    df = queries.get_read_history()
-    df = df[df["ReadStatus"].isin(["FINISHED", "NOT FINISHED"])]
-    df["WeightedScore"] = df["ReadScore"] * df["PageCount"]
 
-    avg_scores = (
-        df.groupby(["Genre"])
-        .agg(WeightedScore=("WeightedScore", "sum"),
-             TotalPages=("PageCount", "sum")))
+def finalize_genre_stats(partials: pd.DataFrame) -> pd.DataFrame:
+    avg_scores = partials.copy()
     avg_scores["AverageScore"] = (
         avg_scores["WeightedScore"] / avg_scores["TotalPages"])
     avg_scores = avg_scores.drop(columns=["WeightedScore"])
-    avg_scores = (avg_scores.reset_index().sort_values("AverageScore",
-                                                       ascending=False))
+    avg_scores = avg_scores.sort_values("AverageScore", ascending=False)
 
     return avg_scores
@@ -1,11 +1,14 @@
 import pandas as pd
 from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
 
 
+@profiled
 def get_next_reads() -> pd.DataFrame:
     return queries.get_next_reads()
 
 
+@profiled
 def get_next_reads_for_table() -> pd.DataFrame:
     df = queries.get_next_reads()
     return (
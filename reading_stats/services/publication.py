@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
+
+
+@dataclass(frozen=True)
+class Histogram2D:
+    counts: np.ndarray
+    published_edges: np.ndarray
+    read_edges: pd.DatetimeIndex
+
+
+@profiled
+def get_publication_vs_read_date(
+        year_bin: int = 10,
+        weighted: bool = True,
+        ) -> Histogram2D:
+    """Bin finished reads by publication year and read month.
+
+    Each read is mapped to an integer bin on both axes and the pairs are
+    counted with a single `np.bincount`, so the cost is linear in the number
+    of reads and the output size only depends on the covered ranges. With
+    `weighted`, every read contributes its page count, otherwise one.
+    """
+    df = queries.get_read_intervals()
+    df = df[df["ReadStatus"] == "FINISHED"].copy()
+    df["StartDate"] = pd.to_datetime(df["StartDate"], errors="coerce")
+    df["FinishDate"] = pd.to_datetime(df["FinishDate"], errors="coerce")
+    df["ReadDate"] = df["FinishDate"].combine_first(df["StartDate"])
+    df = df.dropna(subset=["ReadDate", "PublishedOn"])
+    if weighted:
+        df = df.dropna(subset=["PageCount"])
+    if df.empty:
+        return Histogram2D(
+            counts=np.zeros((0, 0)),
+            published_edges=np.array([], dtype=int),
+            read_edges=pd.DatetimeIndex([]),
+        )
+
+    published = df["PublishedOn"].to_numpy(dtype=int)
+    published_min = published.min() // year_bin * year_bin
+    published_idx = (published - published_min) // year_bin
+    n_published = published_idx.max() + 1
+
+    months = (df["ReadDate"].dt.year * 12
+              + df["ReadDate"].dt.month - 1).to_numpy()
+    read_idx = months - months.min()
+    n_read = read_idx.max() + 1
+
+    counts = np.bincount(
+        published_idx * n_read + read_idx,
+        weights=df["PageCount"].to_numpy(dtype=float) if weighted else None,
+        minlength=n_published * n_read,
+    ).reshape(n_published, n_read)
+
+    first_month = df["ReadDate"].min().to_period("M").to_timestamp()
+    return Histogram2D(
+        counts=counts,
+        published_edges=published_min + year_bin * np.arange(n_published + 1),
+        read_edges=pd.date_range(first_month, periods=n_read + 1, freq="MS"),
+    )
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from reading_stats.config import get_config
+from reading_stats.services import authors, genres
+from reading_stats.utils.profiling import profiled
+
+# Reader databases are queried on at most this many threads.
+MAX_WORKERS = 8
+
+
+def _map_readers(get_partials) -> pd.DataFrame:
+    """Run `get_partials` on every reader database in parallel.
+
+    Only the per-reader partial sums are collected, never the raw read
+    histories, so merging cost grows with the number of distinct keys.
+    """
+    reader_db_paths = dict(get_config().reader_db_paths)
+    readers = list(reader_db_paths)
+    with ThreadPoolExecutor(
+            max_workers=min(len(readers), MAX_WORKERS)) as pool:
+        partials = pool.map(get_partials, reader_db_paths.values())
+        return pd.concat(
+            [df.assign(Reader=reader) for reader, df in zip(readers, partials)],
+            ignore_index=True,
+        )
+
+
+def _merge(partials: pd.DataFrame, key: str) -> pd.DataFrame:
+    return (
+        partials.groupby(key)
+        .agg(WeightedScore=("WeightedScore", "sum"),
+             TotalPages=("TotalPages", "sum"),
+             Readers=("Reader", "nunique"))
+        .reset_index())
+
+
+@profiled
+def get_author_leaderboard() -> pd.DataFrame:
+    # AuthorID is local to each database, so authors are matched by name.
+    partials = _map_readers(authors.get_author_partials)
+    return authors.finalize_author_stats(_merge(partials, "AuthorName"))
+
+
+@profiled
+def get_genre_leaderboard() -> pd.DataFrame:
+    partials = _map_readers(genres.get_genre_partials)
+    return genres.finalize_genre_stats(_merge(partials, "Genre"))
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
+
+
+class ReadingTimeline:
+    """Sweep-line over read intervals.
+
+    Each read covers the days from its start to its finish date, both
+    inclusive. The endpoints are sorted once and a running sum over them gives
+    the number of reads in progress at every breakpoint, so building costs
+    O(n log n) time and O(n) memory and `count_on` is a binary search over the
+    breakpoints.
+
+    `reading_on` keeps the reads sorted by start date instead of storing the
+    active set at every breakpoint, which is what made the build quadratic.
+    A read in progress on a date started at most the longest read's duration
+    before it, so only the reads started in that window are checked.
+    """
+
+    def __init__(self, starts: pd.Series, finishes: pd.Series) -> None:
+        starts_d = starts.to_numpy("datetime64[D]")
+        finishes_d = finishes.to_numpy("datetime64[D]")
+        times = np.concatenate([starts_d, finishes_d + 1])
+        deltas = np.concatenate([np.ones(len(starts_d), dtype=int),
+                                 -np.ones(len(finishes_d), dtype=int)])
+        order = np.argsort(times, kind="stable")
+        times, running = times[order], np.cumsum(deltas[order])
+        # Keep the count after the last endpoint of each distinct date.
+        last = np.ones(len(times), dtype=bool)
+        last[:-1] = times[1:] != times[:-1]
+
+        self.breakpoints = times[last]
+        self.counts = running[last]
+
+        by_start = np.argsort(starts_d, kind="stable")
+        self._starts = starts_d[by_start]
+        self._finishes = finishes_d[by_start]
+        self._read_ids = starts.index.to_numpy()[by_start]
+        self._longest = ((finishes_d - starts_d).max() if len(starts_d)
+                         else np.timedelta64(0, "D"))
+
+    @staticmethod
+    def _to_day(date) -> np.datetime64:
+        return np.datetime64(pd.Timestamp(date).date(), "D")
+
+    def count_on(self, date) -> int:
+        """Return the number of reads in progress on `date`."""
+        i = np.searchsorted(self.breakpoints, self._to_day(date),
+                            side="right") - 1
+        return int(self.counts[i]) if i >= 0 else 0
+
+    def reading_on(self, date) -> tuple:
+        """Return the IDs of the reads in progress on `date`."""
+        date = self._to_day(date)
+        lo = np.searchsorted(self._starts, date - self._longest, side="left")
+        hi = np.searchsorted(self._starts, date, side="right")
+        active = self._finishes[lo:hi] >= date
+        return tuple(np.sort(self._read_ids[lo:hi][active]).tolist())
+
+    def daily_counts(self) -> pd.Series:
+        """Return the number of reads in progress for every day covered."""
+        if len(self.breakpoints) < 2:
+            return pd.Series(dtype=int)
+        lengths = np.diff(self.breakpoints).astype(int)
+        dates = pd.date_range(self.breakpoints[0],
+                              self.breakpoints[-1] - 1, freq="D")
+        return pd.Series(np.repeat(self.counts[:-1], lengths), index=dates)
+
+
+def _get_intervals() -> pd.DataFrame:
+    df = queries.get_read_intervals()
+    df["StartDate"] = pd.to_datetime(df["StartDate"], errors="coerce")
+    df["FinishDate"] = pd.to_datetime(df["FinishDate"], errors="coerce")
+
+    # Open reads end at the latest date in the data rather than today, so
+    # the outputs only change when the database does.
+    in_progress = (df["ReadStatus"] == "IN PROGRESS") & df["FinishDate"].isna()
+    last_date = df[["StartDate", "FinishDate"]].max().max()
+    df.loc[in_progress, "FinishDate"] = last_date
+
+    df = df.dropna(subset=["StartDate", "FinishDate"])
+    df = df[df["FinishDate"] >= df["StartDate"]]
+    return df.set_index("ReadID")
+
+
+@profiled
+def get_reading_timeline() -> ReadingTimeline:
+    df = _get_intervals()
+    return ReadingTimeline(df["StartDate"], df["FinishDate"])
+
+
+@profiled
+def get_reading_pace() -> pd.DataFrame:
+    df = _get_intervals()
+    df = df[df["ReadStatus"] == "FINISHED"].copy()
+    df["Days"] = (df["FinishDate"] - df["StartDate"]).dt.days + 1
+    df["PagesPerDay"] = df["PageCount"] / df["Days"]
+    return df.reset_index().sort_values("PagesPerDay", ascending=False)
+
+
+@profiled
+def get_concurrency() -> pd.DataFrame:
+    counts = get_reading_timeline().daily_counts()
+    return counts.rename("BooksInProgress").rename_axis("Date").reset_index()
+
+
+@profiled
+def get_reading_gaps(top: int = 10) -> pd.DataFrame:
+    timeline = get_reading_timeline()
+    idle = np.flatnonzero(timeline.counts[:-1] == 0)
+    gaps = pd.DataFrame({
+        "StartDate": timeline.breakpoints[idle],
+        "EndDate": timeline.breakpoints[idle + 1] - 1,
+    })
+    gaps["Days"] = (gaps["EndDate"] - gaps["StartDate"]).dt.days + 1
+    return gaps.sort_values("Days", ascending=False).head(top)
+
+
+@profiled
+def get_reads_on(*dates) -> pd.DataFrame:
+    """Return the reads in progress on each of `dates`, one row per pair.
+
+    The timeline is built once and queried for every date.
+    """
+    df = _get_intervals()
+    timeline = ReadingTimeline(df["StartDate"], df["FinishDate"])
+    reads = [
+        df.loc[list(timeline.reading_on(date))].assign(Date=pd.Timestamp(date))
+        for date in dates
+    ]
+    if not reads:
+        return df.iloc[:0].assign(Date=pd.NaT).reset_index()
+    return pd.concat(reads).reset_index()
@@ -0,0 +1,8 @@
+import pandas as pd
+from reading_stats.db import queries
+from reading_stats.utils.profiling import profiled
+
+
+@profiled
+def get_year_stats() -> pd.DataFrame:
+    return queries.get_year_summary()
@@ -0,0 +1,80 @@
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import matplotlib.figure
+
+from reading_stats.utils.paths import ensure_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def write_bytes(path: Path, data: bytes) -> bool:
+    """Atomically replace `path` with `data`.
+
+    The data is written to a temporary file in the same directory and moved
+    into place with `os.replace`, so readers never see a partial file. Nothing
+    is written when the file already holds the same bytes. Returns whether the
+    file changed.
+    """
+    ensure_dir(path)
+    mode = 0o644
+    if path.exists():
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+        mode = path.stat().st_mode & 0o777
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.",
+                                    suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def write_text(path: Path, text: str) -> bool:
+    return write_bytes(path, text.encode("utf-8"))
+
+
+def save_figure(fig: matplotlib.figure.Figure, path: Path,
+                **kwargs) -> bool:
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=path.suffix.lstrip("."), **kwargs)
+    return write_bytes(path, buffer.getvalue())
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Hold an exclusive lock on `path` for the duration of the block.
+
+    The lock is advisory and released by the OS if the process dies, so an
+    interrupted run never leaves a stale lock behind.
+    """
+    ensure_dir(path)
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,155 @@
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from reading_stats.utils.output import write_text
+
+ENV_VAR = "READING_STATS_PROFILE"
+
+_enabled = os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+_origin = time.perf_counter()
+_spans: list["Span"] = []
+_local = threading.local()
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration: float = 0.0
+    start_memory: int = 0
+    peak_memory: int = 0
+    rows: int | None = None
+    thread_id: int = 0
+    children_peak: int = field(default=0, repr=False)
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _get_stack() -> list[Span]:
+    # Spans nest per thread; tracemalloc peaks are still process-wide.
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def span(name: str):
+    if not _enabled:
+        yield None
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    stack = _get_stack()
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # Keep the parent's peak before resetting it for this span.
+        stack[-1].children_peak = max(stack[-1].children_peak, peak)
+    tracemalloc.reset_peak()
+
+    s = Span(name=name, start=time.perf_counter(), start_memory=current,
+             thread_id=threading.get_ident())
+    stack.append(s)
+    try:
+        yield s
+    finally:
+        s.duration = time.perf_counter() - s.start
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, s.children_peak)
+        s.peak_memory = max(peak - s.start_memory, 0)
+        stack.pop()
+        if stack:
+            stack[-1].children_peak = max(stack[-1].children_peak, peak)
+        tracemalloc.reset_peak()
+        _spans.append(s)
+
+
+def profiled(func=None, *, name: str | None = None):
+    """Record a span for every call of the decorated function.
+
+    The span is named after the function (without the package prefix) and
+    stores the row count when the function returns a DataFrame. When
+    profiling is disabled the wrapper only adds a flag check.
+    """
+    if func is None:
+        return functools.partial(profiled, name=name)
+
+    span_name = name or (
+        f"{func.__module__.removeprefix('reading_stats.')}.{func.__name__}")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        with span(span_name) as s:
+            result = func(*args, **kwargs)
+            if isinstance(result, pd.DataFrame):
+                s.rows = len(result)
+            return result
+
+    return wrapper
+
+
+def write_trace(output_path: Path) -> None:
+    """Write the recorded spans in Chrome trace event format."""
+    pid = os.getpid()
+    events = [
+        {
+            "name": s.name,
+            "cat": s.name.split(".")[0],
+            "ph": "X",
+            "ts": round((s.start - _origin) * 1e6, 1),
+            "dur": round(s.duration * 1e6, 1),
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": {"peak_memory_kib": round(s.peak_memory / 1024, 1),
+                     "rows": s.rows},
+        }
+        for s in sorted(_spans, key=lambda s: s.start)
+    ]
+    write_text(output_path,
+               json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+def summary() -> pd.DataFrame:
+    df = pd.DataFrame(
+        [(s.name, s.duration * 1e3, s.peak_memory / 1024, s.rows)
+         for s in _spans],
+        columns=["Stage", "Time (ms)", "Peak memory (KiB)", "Rows"],
+    )
+    return (
+        df.groupby("Stage", sort=False)
+        .agg(**{
+            "Calls": ("Time (ms)", "size"),
+            "Time (ms)": ("Time (ms)", "sum"),
+            "Peak memory (KiB)": ("Peak memory (KiB)", "max"),
+            "Rows": ("Rows", "max"),
+        })
+        .astype({"Rows": "Int64"})
+        .reset_index()
+        .sort_values("Time (ms)", ascending=False)
+    )
+
+
+def print_summary() -> None:
+    if not _spans:
+        return
+    print(summary().to_markdown(index=False, floatfmt=".1f"))
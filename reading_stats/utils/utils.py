@@ -1,8 +1,16 @@
 from pathlib import Path
 
+from reading_stats.utils.output import file_lock, write_text
+
 
 def append_to_readme(text_to_append: str, anchor: str) -> None:
     file_path = Path("README.md")
+    with file_lock(file_path.with_name(".README.md.lock")):
+        _replace_section(file_path, text_to_append, anchor)
+
+
+def _replace_section(file_path: Path, text_to_append: str,
+                     anchor: str) -> None:
     content = file_path.read_text(encoding="utf-8")
     lines = content.splitlines(keepends=True)
 
@@ -19,7 +27,7 @@ def append_to_readme(text_to_append: str, anchor: str) -> None:
             new_lines.append(text_to_append + "\n")
             new_lines.append("\n")
             new_lines.extend(lines[next_section:])
-            file_path.write_text("".join(new_lines), encoding="utf-8")
+            write_text(file_path, "".join(new_lines))
             return
 
     raise ValueError(f"Anchor '{anchor}' not found.")
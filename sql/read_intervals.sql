@@ -0,0 +1,14 @@
+SELECT
+    R.ReadID              AS ReadID,
+    W.WorkID              AS WorkID,
+    W.Name                AS WorkName,
+    W.WorkType            AS WorkType,
+    W.PublishedOn         AS PublishedOn,
+    W.PageCount           AS PageCount,
+    R.StartDate           AS StartDate,
+    R.FinishDate          AS FinishDate,
+    R.Status              AS ReadStatus
+FROM READS R
+JOIN WORKS W
+    ON R.WorkID = W.WorkID
+ORDER BY R.StartDate, R.ReadID;
\ No newline at end of file
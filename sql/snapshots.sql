@@ -0,0 +1,17 @@
+CREATE TABLE IF NOT EXISTS SNAPSHOT_LOG (
+    ChangeID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    ChangedAt TEXT NOT NULL,
+    TableName TEXT NOT NULL,
+    RowID INTEGER NOT NULL,
+    RowData TEXT
+);
+
+CREATE TABLE IF NOT EXISTS SNAPSHOT_CHECKPOINTS (
+    CheckpointID INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    CreatedAt TEXT NOT NULL,
+    LastChangeID INTEGER NOT NULL,
+    Data BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS IX_SNAPSHOT_CHECKPOINTS_CREATED
+    ON SNAPSHOT_CHECKPOINTS (CreatedAt);
\ No newline at end of file
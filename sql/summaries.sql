@@ -0,0 +1,30 @@
+CREATE TABLE IF NOT EXISTS AUTHOR_SUMMARY (
+    AuthorID INTEGER PRIMARY KEY NOT NULL,
+    AuthorName TEXT,
+    WeightedScore REAL,
+    TotalPages INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS GENRE_SUMMARY (
+    Genre TEXT PRIMARY KEY NOT NULL,
+    WeightedScore REAL,
+    TotalPages INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS WORK_SUMMARY (
+    WorkID INTEGER PRIMARY KEY NOT NULL,
+    TimesRead INTEGER,
+    ReadScore REAL,
+    LastReadOn TEXT
+);
+
+CREATE TABLE IF NOT EXISTS YEAR_SUMMARY (
+    Year INTEGER PRIMARY KEY NOT NULL,
+    WorksRead INTEGER,
+    PagesRead INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS IX_READS_WORK ON READS (WorkID);
+CREATE INDEX IF NOT EXISTS IX_AUTHOR_WORK_WORK ON AUTHOR_WORK (WorkID);
+CREATE INDEX IF NOT EXISTS IX_AUTHOR_WORK_AUTHOR ON AUTHOR_WORK (AuthorID);
+CREATE INDEX IF NOT EXISTS IX_WORKS_GENRE ON WORKS (Genre);
\ No newline at end of file
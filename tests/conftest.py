@@ -0,0 +1,14 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+DB_PATH = Path(__file__).parent.parent / "data" / "raw" / "books.db"
+
+
+@pytest.fixture
+def books_db(tmp_path) -> Path:
+    """Return a copy of books.db that the test is free to modify."""
+    db_path = tmp_path / "books.db"
+    shutil.copy(DB_PATH, db_path)
+    return db_path
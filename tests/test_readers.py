@@ -0,0 +1,47 @@
+import dataclasses
+import shutil
+import sqlite3
+
+import pandas as pd
+import pytest
+from reading_stats import config
+from reading_stats.services import authors, genres, readers
+
+
+@pytest.fixture
+def reader_dbs(books_db, tmp_path, monkeypatch):
+    """Split the reads of books.db between two reader databases."""
+    paths = {"odd": tmp_path / "odd.db", "even": tmp_path / "even.db"}
+    for remainder, path in enumerate([paths["even"], paths["odd"]]):
+        shutil.copy(books_db, path)
+        with sqlite3.connect(path) as conn:
+            conn.execute("DELETE FROM READS WHERE ReadID % 2 <> ?",
+                         (remainder,))
+    monkeypatch.setattr(config, "_config", dataclasses.replace(
+        config.get_config(), reader_db_paths=tuple(paths.items())))
+    return books_db
+
+
+def _assert_same_stats(merged: pd.DataFrame, full: pd.DataFrame,
+                       key: str) -> None:
+    columns = [c for c in full.columns if c in merged.columns]
+    pd.testing.assert_frame_equal(
+        merged[columns].sort_values(key).reset_index(drop=True),
+        full[columns].sort_values(key).reset_index(drop=True),
+        check_exact=False, rtol=1e-12,
+    )
+
+
+def test_author_leaderboard_combines_exactly(reader_dbs):
+    merged = readers.get_author_leaderboard()
+    full = authors.get_author_stats(reader_dbs)
+    assert full["AuthorName"].is_unique
+    assert merged["Readers"].max() == 2
+    _assert_same_stats(merged, full, "AuthorName")
+
+
+def test_genre_leaderboard_combines_exactly(reader_dbs):
+    merged = readers.get_genre_leaderboard()
+    full = genres.get_genre_stats(reader_dbs)
+    assert merged["Readers"].max() == 2
+    _assert_same_stats(merged, full, "Genre")
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+from reading_stats.db import queries
+from reading_stats.services import reading_time
+
+FIRST_DAY = pd.Timestamp("2024-01-01")
+
+
+@pytest.fixture
+def intervals(monkeypatch) -> pd.DataFrame:
+    """Random reads over 200 days, with an open one and an undated one."""
+    rng = np.random.default_rng(0)
+    n = 60
+    starts = FIRST_DAY + pd.to_timedelta(rng.integers(0, 200, n), unit="D")
+    finishes = starts + pd.to_timedelta(rng.integers(0, 30, n), unit="D")
+    df = pd.DataFrame({
+        "ReadID": np.arange(1, n + 1),
+        "PageCount": rng.integers(50, 800, n),
+        "StartDate": starts.strftime("%Y-%m-%d"),
+        "FinishDate": finishes.strftime("%Y-%m-%d"),
+        "ReadStatus": "FINISHED",
+    })
+    df.loc[0, ["FinishDate", "ReadStatus"]] = [None, "IN PROGRESS"]
+    df.loc[1, ["StartDate", "FinishDate"]] = [None, None]
+    monkeypatch.setattr(queries, "get_read_intervals", lambda: df.copy())
+    return df
+
+
+def _brute_force(df: pd.DataFrame) -> tuple[pd.DatetimeIndex, list[set]]:
+    starts = pd.to_datetime(df["StartDate"])
+    finishes = pd.to_datetime(df["FinishDate"])
+    finishes[df["ReadStatus"] == "IN PROGRESS"] = max(starts.max(),
+                                                      finishes.max())
+    days = pd.date_range(starts.min(), finishes.max(), freq="D")
+    active = [
+        set(df.loc[(starts <= day) & (finishes >= day), "ReadID"])
+        for day in days
+    ]
+    return days, active
+
+
+def test_counts_and_reads_match_brute_force(intervals):
+    days, active = _brute_force(intervals)
+    timeline = reading_time.get_reading_timeline()
+
+    counts = timeline.daily_counts()
+    assert counts.index.equals(days)
+    assert counts.tolist() == [len(a) for a in active]
+    for day, reads in zip(days, active):
+        assert timeline.count_on(day) == len(reads)
+        assert set(timeline.reading_on(day)) == reads
+    assert timeline.count_on(days[0] - pd.Timedelta(days=1)) == 0
+    assert timeline.reading_on(days[-1] + pd.Timedelta(days=1)) == ()
+
+
+def test_gaps_match_brute_force(intervals):
+    days, active = _brute_force(intervals)
+    idle = pd.Series([not a for a in active], index=days)
+    runs = (idle != idle.shift()).cumsum()[idle]
+    expected = sorted(
+        (len(g), g.index[0], g.index[-1]) for _, g in runs.groupby(runs))
+    assert expected
+
+    gaps = reading_time.get_reading_gaps(top=len(days))
+    assert sorted(zip(gaps["Days"], gaps["StartDate"],
+                      gaps["EndDate"])) == expected
+
+
+def test_pace_matches_brute_force(intervals):
+    finished = intervals[intervals["ReadStatus"] == "FINISHED"].dropna()
+    days = (pd.to_datetime(finished["FinishDate"])
+            - pd.to_datetime(finished["StartDate"])).dt.days + 1
+    expected = dict(zip(finished["ReadID"], finished["PageCount"] / days))
+
+    pace = reading_time.get_reading_pace()
+    assert dict(zip(pace["ReadID"], pace["PagesPerDay"])) == pytest.approx(
+        expected)
+    assert pace["PagesPerDay"].is_monotonic_decreasing
+
+
+def test_reads_on_several_dates(intervals):
+    days, active = _brute_force(intervals)
+    picked = [days[10], days[50], days[100]]
+
+    reads = reading_time.get_reads_on(*picked)
+    for day in picked:
+        assert (set(reads.loc[reads["Date"] == day, "ReadID"])
+                == active[days.get_loc(day)])
+
+
+def test_empty_timeline():
+    empty = pd.Series([], dtype="datetime64[ns]")
+    timeline = reading_time.ReadingTimeline(empty, empty)
+    assert timeline.daily_counts().empty
+    assert timeline.count_on("2024-01-01") == 0
+    assert timeline.reading_on("2024-01-01") == ()
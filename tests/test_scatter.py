@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from reading_stats.charts.scatter import spread_labels
+
+
+@pytest.mark.parametrize("y", [
+    np.array([0.99, 0.995]),
+    np.array([0.0, 0.001, 0.5]),
+    np.array([0.3, 0.31, 0.3, 0.7]),
+    np.random.default_rng(0).uniform(0, 1, 15),
+])
+def test_spread_labels_within_axes_and_apart(y):
+    min_gap = 0.04
+    spread = spread_labels(y, min_gap)
+
+    ordered = spread[np.argsort(y, kind="stable")]
+    assert np.all(np.diff(ordered) >= min_gap - 1e-12)
+    assert spread.min() >= min_gap / 2 - 1e-12
+    assert spread.max() <= 1 - min_gap / 2 + 1e-12
+
+
+def test_spread_labels_keeps_separated_labels():
+    y = np.array([0.2, 0.5, 0.8])
+    np.testing.assert_allclose(spread_labels(y, 0.04), y)
+
+
+def test_spread_labels_near_top_edge():
+    np.testing.assert_allclose(
+        spread_labels(np.array([0.99, 0.995]), 0.04), [0.94, 0.98])
@@ -0,0 +1,75 @@
+import sqlite3
+import warnings
+from pathlib import Path
+
+import pytest
+from reading_stats.db import queries
+from reading_stats.db.snapshots import (
+    ApproximateSnapshotWarning,
+    checkpoint,
+    install_snapshots,
+)
+
+# The history is rebuilt in the copy with fixed timestamps, so the tests
+# don't depend on the log committed in books.db.
+CHECKPOINT_AT = "2030-01-01 12:00:00"
+CHANGED_AT = "2030-06-01 12:00:00"
+
+
+@pytest.fixture
+def db_path(books_db):
+    conn = sqlite3.connect(books_db)
+    install_snapshots(conn)
+    with conn:
+        conn.execute("DELETE FROM SNAPSHOT_LOG")
+        conn.execute("DELETE FROM SNAPSHOT_CHECKPOINTS")
+    checkpoint(conn)
+    with conn:
+        conn.execute("UPDATE SNAPSHOT_CHECKPOINTS SET CreatedAt = ?",
+                     (CHECKPOINT_AT,))
+    conn.close()
+    return books_db
+
+
+def _add_read(db_path: Path) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO READS (WorkID, StartDate, FinishDate, Score, Status)"
+            " SELECT MIN(WorkID), '2030-05-01', '2030-05-20', 4.0, 'FINISHED'"
+            " FROM WORKS")
+        conn.execute("UPDATE SNAPSHOT_LOG SET ChangedAt = ?", (CHANGED_AT,))
+
+
+def _exact_year_summary(db_path: Path, as_of: str):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ApproximateSnapshotWarning)
+        return queries.get_year_summary(db_path, as_of=as_of)
+
+
+def test_as_of_replays_changes_after_checkpoint(db_path):
+    before = queries.get_year_summary(db_path)
+    _add_read(db_path)
+    after = queries.get_year_summary(db_path)
+    assert not before.equals(after)
+
+    assert _exact_year_summary(db_path, "2030-01-01").equals(before)
+    assert _exact_year_summary(db_path, "2030-05-31").equals(before)
+    assert _exact_year_summary(db_path, "2030-06-01").equals(after)
+
+
+def test_as_of_before_checkpoint_is_approximated(db_path):
+    current = queries.get_year_summary(db_path)
+    last_year = int(current["Year"].max())
+
+    with pytest.warns(ApproximateSnapshotWarning):
+        past = queries.get_year_summary(db_path,
+                                        as_of=f"{last_year - 1}-12-31")
+    assert past["Year"].max() == last_year - 1
+    assert past.equals(current[current["Year"] < last_year])
+
+
+def test_as_of_without_checkpoints_raises(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM SNAPSHOT_CHECKPOINTS")
+    with pytest.raises(ValueError):
+        queries.get_year_summary(db_path, as_of="2020-01-01")
@@ -0,0 +1,154 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+from reading_stats.db import queries
+from reading_stats.db.summaries import (
+    SUMMARIES,
+    has_summaries,
+    rebuild_summaries,
+)
+
+_KEYS = {
+    "AUTHOR_SUMMARY": "AuthorID",
+    "GENRE_SUMMARY": "Genre",
+    "WORK_SUMMARY": "WorkID",
+    "YEAR_SUMMARY": "Year",
+}
+
+# The most read work and its first author, so every mutation touches rows
+# that feed several summaries.
+_TOP_WORK = ("(SELECT WorkID FROM READS GROUP BY WorkID"
+             " ORDER BY COUNT(*) DESC, WorkID LIMIT 1)")
+_TOP_AUTHOR = (f"(SELECT MIN(AuthorID) FROM AUTHOR_WORK"
+               f" WHERE WorkID = {_TOP_WORK})")
+_OTHER_AUTHOR = (f"(SELECT MAX(AuthorID) FROM AUTHORS"
+                 f" WHERE AuthorID <> {_TOP_AUTHOR})")
+
+MUTATIONS = {
+    "insert_read": [
+        "INSERT INTO READS (WorkID, StartDate, FinishDate, Score, Status)"
+        f" VALUES ({_TOP_WORK}, '2011-03-01', '2011-03-20', 3.5, 'FINISHED')",
+    ],
+    "update_read_score": [
+        f"UPDATE READS SET Score = Score + 1 WHERE WorkID = {_TOP_WORK}",
+    ],
+    "update_read_dates": [
+        "UPDATE READS SET FinishDate = '1999-12-31'"
+        " WHERE ReadID = (SELECT MAX(ReadID) FROM READS"
+        " WHERE Status = 'FINISHED')",
+    ],
+    "update_read_status": [
+        "UPDATE READS SET Status = 'NOT FINISHED'"
+        f" WHERE WorkID = {_TOP_WORK}",
+    ],
+    "update_read_work": [
+        f"UPDATE READS SET WorkID = (SELECT MAX(WorkID) FROM WORKS)"
+        f" WHERE WorkID = {_TOP_WORK}",
+    ],
+    "delete_read": [
+        f"DELETE FROM READS WHERE WorkID = {_TOP_WORK}",
+    ],
+    "insert_work": [
+        "INSERT INTO WORKS (WorkID, Name, Genre, PageCount)"
+        " VALUES (100000, 'New Work', 'Fiction: Horror', 321)",
+        "INSERT INTO READS (WorkID, StartDate, FinishDate, Score, Status)"
+        " VALUES (100000, '2012-01-01', '2012-01-10', 4.0, 'FINISHED')",
+        f"INSERT INTO AUTHOR_WORK (AuthorID, WorkID)"
+        f" VALUES ({_TOP_AUTHOR}, 100000)",
+    ],
+    "insert_work_for_dangling_read": [
+        "INSERT INTO READS (WorkID, StartDate, FinishDate, Score, Status)"
+        " VALUES (100000, '2012-01-01', '2012-01-10', 4.0, 'FINISHED')",
+        "INSERT INTO WORKS (WorkID, Name, Genre, PageCount)"
+        " VALUES (100000, 'New Work', 'Fiction: Horror', 321)",
+    ],
+    "update_work_pages": [
+        f"UPDATE WORKS SET PageCount = PageCount + 100"
+        f" WHERE WorkID = {_TOP_WORK}",
+    ],
+    "update_work_genre": [
+        f"UPDATE WORKS SET Genre = 'Fiction: Western'"
+        f" WHERE WorkID = {_TOP_WORK}",
+    ],
+    "update_work_id": [
+        f"UPDATE WORKS SET WorkID = 100000 WHERE WorkID = {_TOP_WORK}",
+    ],
+    "delete_work": [
+        f"DELETE FROM WORKS WHERE WorkID = {_TOP_WORK}",
+    ],
+    "insert_author_work": [
+        f"INSERT INTO AUTHOR_WORK (AuthorID, WorkID)"
+        f" VALUES ({_OTHER_AUTHOR}, {_TOP_WORK})",
+    ],
+    "update_author_work": [
+        f"UPDATE AUTHOR_WORK SET AuthorID = {_OTHER_AUTHOR}"
+        f" WHERE WorkID = {_TOP_WORK}",
+    ],
+    "delete_author_work": [
+        f"DELETE FROM AUTHOR_WORK WHERE WorkID = {_TOP_WORK}",
+    ],
+    "insert_author_for_dangling_work": [
+        f"INSERT INTO AUTHOR_WORK (AuthorID, WorkID)"
+        f" VALUES (100000, {_TOP_WORK})",
+        "INSERT INTO AUTHORS (AuthorID, Name) VALUES (100000, 'New Author')",
+    ],
+    "update_author_name": [
+        f"UPDATE AUTHORS SET Name = 'Renamed' WHERE AuthorID = {_TOP_AUTHOR}",
+    ],
+    "update_author_id": [
+        f"UPDATE AUTHORS SET AuthorID = 100000 WHERE AuthorID = {_TOP_AUTHOR}",
+    ],
+    "delete_author": [
+        f"DELETE FROM AUTHORS WHERE AuthorID = {_TOP_AUTHOR}",
+    ],
+}
+
+
+@pytest.fixture
+def conn(books_db):
+    conn = sqlite3.connect(books_db)
+    rebuild_summaries(conn)
+    yield conn
+    conn.close()
+
+
+def _read_summaries(conn: sqlite3.Connection) -> dict[str, pd.DataFrame]:
+    return {
+        table: pd.read_sql(
+            f"SELECT * FROM {table} ORDER BY {_KEYS[table]}", conn)
+        for table in SUMMARIES
+    }
+
+
+def _assert_matches_rebuild(conn: sqlite3.Connection) -> None:
+    maintained = _read_summaries(conn)
+    rebuild_summaries(conn)
+    rebuilt = _read_summaries(conn)
+    for table in SUMMARIES:
+        pd.testing.assert_frame_equal(maintained[table], rebuilt[table],
+                                      check_exact=False, obj=table)
+
+
+@pytest.mark.parametrize("statements", MUTATIONS.values(), ids=MUTATIONS)
+def test_triggers_match_rebuild(conn, statements):
+    before = _read_summaries(conn)
+    with conn:
+        for statement in statements:
+            assert conn.execute(statement).rowcount > 0, statement
+    after = _read_summaries(conn)
+    assert any(not before[t].equals(after[t]) for t in SUMMARIES)
+    _assert_matches_rebuild(conn)
+
+
+def test_summaries_created_on_first_read(books_db):
+    with sqlite3.connect(books_db) as conn:
+        expected = queries.get_author_summary(books_db)
+        for table in SUMMARIES:
+            conn.execute(f"DROP TABLE {table}")
+        assert not has_summaries(conn)
+
+    pd.testing.assert_frame_equal(queries.get_author_summary(books_db),
+                                  expected)
+    with sqlite3.connect(books_db) as conn:
+        assert has_summaries(conn)